@@ -0,0 +1,3 @@
+"""
+Python package for the PythonTools plugin.
+"""
\ No newline at end of file
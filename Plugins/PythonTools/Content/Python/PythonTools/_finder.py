@@ -0,0 +1,75 @@
+"""
+Import finder for the Snippets Python modules.
+The Snippets layout is scanned once at startup, so importing a snippet is a dictionary
+lookup rather than a stat of every sys.path entry.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+class SnippetFinder(importlib.abc.MetaPathFinder):
+    """
+    Resolve Snippets.Python modules from a map built at startup.
+    """
+    def __init__(self, snippets_dir, snippet_dirs=None):
+        """
+        Build the module map.
+        
+        Args:
+            snippets_dir (str): Path to the project's Snippets directory
+            snippet_dirs (list): Optional names of the Snippets subdirectories, if already known
+        """
+        self._packages = {}
+        self._modules = {}
+        
+        # Skip the scan when we already know there's no Python directory
+        if snippet_dirs is not None and "Python" not in snippet_dirs:
+            return
+        
+        python_dir = os.path.join(snippets_dir, "Python")
+        try:
+            with os.scandir(python_dir) as it:
+                for entry in it:
+                    module_name, ext = os.path.splitext(entry.name)
+                    if ext == ".py" and entry.is_file():
+                        self._modules[f"Snippets.Python.{module_name}"] = entry.path
+        except OSError:
+            return
+        
+        self._packages = {
+            "Snippets": snippets_dir,
+            "Snippets.Python": python_dir,
+        }
+    
+    def find_spec(self, fullname, path=None, target=None):
+        """
+        Return a spec for known snippet modules, or None for everything else.
+        """
+        file_path = self._modules.get(fullname)
+        if file_path is not None:
+            return importlib.util.spec_from_file_location(fullname, file_path)
+        
+        # Snippets and Snippets.Python have no __init__.py, treat them as namespace packages
+        package_dir = self._packages.get(fullname)
+        if package_dir is not None:
+            spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = [package_dir]
+            return spec
+        
+        return None
+
+def install(snippets_dir, snippet_dirs=None):
+    """
+    Insert a SnippetFinder at the front of sys.meta_path if one isn't there already.
+    
+    Args:
+        snippets_dir (str): Path to the project's Snippets directory
+        snippet_dirs (list): Optional names of the Snippets subdirectories, if already known
+    """
+    if any(isinstance(finder, SnippetFinder) for finder in sys.meta_path):
+        return
+    
+    sys.meta_path.insert(0, SnippetFinder(snippets_dir, snippet_dirs))
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Dispatch table for Python menu entries.
+Menu entries call run() with their menu and entry name instead of resolving the callable from a command string.
+"""
+
+# Callables registered for each menu entry, keyed by (menu_name, entry_name)
+_CALLBACKS = {}
+
+# Menu entries that have been added, as (menu_name, entry_name) pairs
+_ENTRIES = set()
+
+# Set once the startup script has scheduled its menu registration.
+# Kept here rather than in the startup script so re-running that script doesn't reset it.
+_startup_registered = False
+
+def claim_startup_registration():
+    """
+    Mark the startup menu registration as scheduled.
+    
+    Returns:
+        bool: True the first time it's called in an editor session, False after that
+    """
+    global _startup_registered
+    if _startup_registered:
+        return False
+    _startup_registered = True
+    return True
+
+def register(menu_name, entry_name, python_callable):
+    """
+    Register the callable to run when a menu entry is clicked.
+    
+    Args:
+        menu_name (str): Name of the menu the entry is in
+        entry_name (str): Name of the menu entry
+        python_callable (callable): Python function to call when the menu entry is clicked
+    """
+    _CALLBACKS[(menu_name, entry_name)] = python_callable
+
+def run(menu_name, entry_name):
+    """
+    Run the callable registered for a menu entry.
+    
+    Args:
+        menu_name (str): Name of the menu the entry is in
+        entry_name (str): Name of the menu entry
+    """
+    _CALLBACKS[(menu_name, entry_name)]()
+
+def has_entry(menu_name, entry_name):
+    """
+    Check whether a menu entry has already been added.
+    
+    Args:
+        menu_name (str): Name of the menu
+        entry_name (str): Name of the menu entry
+        
+    Returns:
+        bool: True if the entry was added before
+    """
+    return (menu_name, entry_name) in _ENTRIES
+
+def add_entry(menu_name, entry_name):
+    """
+    Record that a menu entry has been added.
+    
+    Args:
+        menu_name (str): Name of the menu
+        entry_name (str): Name of the menu entry
+    """
+    _ENTRIES.add((menu_name, entry_name))
\ No newline at end of file
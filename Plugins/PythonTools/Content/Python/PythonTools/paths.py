@@ -0,0 +1,84 @@
+"""
+Python path setup for the PythonTools plugin.
+Both init scripts call ensure_paths(), so the work is only done once per editor session.
+"""
+
+import unreal
+import os
+import sys
+
+# Set UE_PYTHONTOOLS_VERBOSE to log the init banners
+VERBOSE = bool(os.environ.get("UE_PYTHONTOOLS_VERBOSE"))
+
+# Project directories, looked up once when the module is first imported
+_PROJ = unreal.Paths.project_dir()
+_CONTENT = unreal.Paths.project_content_dir()
+_PLUGINS = unreal.Paths.project_plugins_dir()
+
+# The project's Content/Python directory
+PROJECT_PYTHON = os.path.join(_CONTENT, "Python")
+
+# The plugin's Python directory
+PLUGIN_PYTHON = os.path.join(_PLUGINS, "PythonTools", "Content", "Python")
+
+# The Snippets directory
+SNIPPETS = os.path.join(_PROJ, "Snippets")
+
+# Subdirectories of Snippets, or None if it can't be listed. Filled in by ensure_paths().
+SNIPPET_DIRS = None
+
+# Set once the paths have been added
+_done = False
+
+def _add(path, known, added):
+    """
+    Append a path to sys.path unless it's already in the known set.
+    
+    Args:
+        path (str): Path to add
+        known (set): Paths already on sys.path, updated in place
+        added (list): Paths added so far, updated in place
+    """
+    if path not in known:
+        sys.path.append(path)
+        known.add(path)
+        added.append(path)
+
+def ensure_paths():
+    """
+    Set up additional Python paths for the Unreal Engine Python environment.
+    Calling this more than once is a no-op.
+    """
+    global _done, SNIPPET_DIRS
+    if _done:
+        return
+    
+    # Snapshot sys.path once so membership tests don't rescan the list
+    _sp = set(sys.path)
+    added = []
+    
+    # Add the project's Python directory to sys.path.
+    # Missing directories are harmless, the importer just skips them.
+    _add(PROJECT_PYTHON, _sp, added)
+    
+    # Add the plugin's Python directory to sys.path
+    _add(PLUGIN_PYTHON, _sp, added)
+    
+    # Add the Snippets directory to sys.path if it exists.
+    # scandir lists it in one call, and the subdirectories are kept for the snippet finder.
+    # Any OSError (missing, not a directory, unreadable) just means there are no snippets.
+    try:
+        with os.scandir(SNIPPETS) as it:
+            entries = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        entries = None
+    SNIPPET_DIRS = entries
+    
+    if entries is not None:
+        _add(SNIPPETS, _sp, added)
+    
+    # Log all the added paths in one line
+    if added:
+        unreal.log("PythonTools paths: " + ", ".join(added))
+    
+    _done = True
\ No newline at end of file
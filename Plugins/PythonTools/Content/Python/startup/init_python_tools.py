@@ -4,55 +4,46 @@ This script is automatically executed when the editor starts.
 """
 
 import unreal
-import os
-import sys
-import importlib
 
-def setup_python_paths():
+def _editor_automation():
     """
-    Set up Python paths for the project.
+    Import the editor automation module on first use.
     """
-    # Get the current project's Content/Python directory
-    project_content_dir = unreal.Paths.project_content_dir()
-    project_python_dir = os.path.join(project_content_dir, "Python")
-    
-    # Add the project's Python directory to sys.path if it exists
-    if os.path.exists(project_python_dir) and project_python_dir not in sys.path:
-        sys.path.append(project_python_dir)
-        unreal.log(f"Added project Python path: {project_python_dir}")
+    import Snippets.Python.editor_automation as m
+    return m
+
+def register_menu_commands():
+    """
+    Register Python commands in the editor menus.
     
-    # Get the plugin's Python directory
-    plugins_dir = unreal.Paths.project_plugins_dir()
-    python_tools_dir = os.path.join(plugins_dir, "PythonTools", "Content", "Python")
+    Registration runs on the first editor tick, once the main window is up,
+    so it doesn't block editor startup. Calling this more than once is a no-op.
+    """
+    # The flag lives in an imported module, so it survives this script being re-run
+    from PythonTools import menu_dispatch
+    if not menu_dispatch.claim_startup_registration():
+        return
     
-    # Add the plugin's Python directory to sys.path if it exists
-    if os.path.exists(python_tools_dir) and python_tools_dir not in sys.path:
-        sys.path.append(python_tools_dir)
-        unreal.log(f"Added plugin Python path: {python_tools_dir}")
+    def _on_tick(delta_seconds):
+        unreal.unregister_slate_post_tick_callback(handle)
+        _register_menu_commands()
     
-    # Add the Snippets directory to sys.path
-    snippets_dir = os.path.join(unreal.Paths.project_dir(), "Snippets")
-    if os.path.exists(snippets_dir) and snippets_dir not in sys.path:
-        sys.path.append(snippets_dir)
-        unreal.log(f"Added Snippets path: {snippets_dir}")
+    handle = unreal.register_slate_post_tick_callback(_on_tick)
 
-def register_menu_commands():
+def _register_menu_commands():
     """
-    Register Python commands in the editor menus.
+    Register the example commands and their menu entries.
     """
     try:
-        # Import the editor automation module
-        from Snippets.Python import editor_automation
-        
         # Define some example commands
         def list_static_meshes():
             from Snippets.Python import asset_management
-            static_meshes = asset_management.find_assets_by_class('StaticMesh')
-            unreal.log(f"Found {len(static_meshes)} static meshes in the project")
+            num_static_meshes = asset_management.count_assets_by_class('StaticMesh')
+            unreal.log(f"Found {num_static_meshes} static meshes in the project")
             
             # Show a notification
             unreal.EditorNotification.show_notification(
-                unreal.Text(f"Found {len(static_meshes)} static meshes"),
+                unreal.Text(f"Found {num_static_meshes} static meshes"),
                 unreal.EditorNotificationDuration.SHORT
             )
         
@@ -67,6 +58,9 @@ def register_menu_commands():
                 unreal.EditorNotificationDuration.SHORT
             )
         
+        # Import the editor automation module
+        editor_automation = _editor_automation()
+        
         # Register the commands
         editor_automation.register_editor_command("ListStaticMeshes", list_static_meshes, "List all static meshes in the project")
         editor_automation.register_editor_command("CreateActorGrid", create_actor_grid, "Create a 5x5 grid of actors")
@@ -74,6 +68,7 @@ def register_menu_commands():
         # Create menu entries
         editor_automation.create_menu_entry("LevelEditor.MainMenu.Window", "List Static Meshes", list_static_meshes)
         editor_automation.create_menu_entry("LevelEditor.MainMenu.Window", "Create Actor Grid", create_actor_grid)
+        editor_automation.refresh_menus()
         
         unreal.log("Registered Python menu commands")
     except Exception as e:
@@ -84,15 +79,18 @@ def initialize():
     Main initialization function.
     """
     try:
-        unreal.log("Initializing Python Tools...")
+        from PythonTools import paths
+        if paths.VERBOSE:
+            unreal.log("Initializing Python Tools...")
         
         # Set up Python paths
-        setup_python_paths()
+        paths.ensure_paths()
         
         # Register menu commands
         register_menu_commands()
         
-        unreal.log("Python Tools initialized successfully!")
+        if paths.VERBOSE:
+            unreal.log("Python Tools initialized successfully!")
     except Exception as e:
         unreal.log_error(f"Failed to initialize Python Tools: {e}")
 
@@ -5,9 +5,43 @@ This module provides functions for managing assets in Unreal Engine projects.
 """
 
 import unreal
-import os
+import time
+from functools import lru_cache
 
-def list_assets(directory_path, recursive=True, include_only_on_disk=False):
+# How long count_assets_by_class() results are reused, in seconds
+_COUNT_TTL_SECONDS = 20
+
+@lru_cache(maxsize=1)
+def _asset_registry():
+    """
+    Get the asset registry, looked up once per session.
+    """
+    return unreal.AssetRegistryHelpers.get_asset_registry()
+
+@lru_cache(maxsize=1)
+def _asset_tools():
+    """
+    Get the asset tools, looked up once per session.
+    """
+    return unreal.AssetToolsHelpers.get_asset_tools()
+
+@lru_cache(maxsize=64)
+def _make_filter(class_names, package_paths, recursive, only_on_disk=False):
+    """
+    Build an asset registry filter, cached per combination of arguments.
+    
+    The arguments must be tuples so they can be used as cache keys. get_assets()
+    copies the filter it is given, so a cached filter can be reused as long as
+    callers don't modify it.
+    """
+    return unreal.ARFilter(
+        class_names=list(class_names),
+        package_paths=list(package_paths),
+        recursive_paths=recursive,
+        include_only_on_disk_assets=only_on_disk
+    )
+
+def list_assets(directory_path, recursive=True, include_only_on_disk=False, class_names=None):
     """
     List all assets in a specified directory.
     
@@ -15,18 +49,20 @@ def list_assets(directory_path, recursive=True, include_only_on_disk=False):
         directory_path (str): Path to the directory to search, e.g., '/Game/MyFolder'
         recursive (bool): Whether to search subdirectories
         include_only_on_disk (bool): Whether to include only assets that exist on disk
+        class_names (list): Optional class names to filter by, e.g., ['StaticMesh'].
+            Defaults to all assets.
         
     Returns:
         list: List of asset data objects
     """
-    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset_registry = _asset_registry()
     
     # Create a filter for the asset registry
-    ar_filter = unreal.ARFilter(
-        class_names=['Object'],
-        package_paths=[directory_path],
-        recursive_paths=recursive,
-        include_only_on_disk_assets=include_only_on_disk
+    ar_filter = _make_filter(
+        tuple(class_names) if class_names else ('Object',),
+        (directory_path,),
+        recursive,
+        include_only_on_disk
     )
     
     # Get all assets that match the filter
@@ -34,7 +70,7 @@ def list_assets(directory_path, recursive=True, include_only_on_disk=False):
     
     return assets
 
-def find_assets_by_class(asset_class, directory_path='/Game', recursive=True):
+def find_assets_by_class(asset_class, directory_path='/Game', recursive=True, count_only=False):
     """
     Find all assets of a specific class.
     
@@ -42,24 +78,52 @@ def find_assets_by_class(asset_class, directory_path='/Game', recursive=True):
         asset_class (str): Class name to search for, e.g., 'StaticMesh', 'Material'
         directory_path (str): Path to search in
         recursive (bool): Whether to search subdirectories
+        count_only (bool): Return only the number of matching assets
         
     Returns:
-        list: List of asset data objects
+        list: List of asset data objects, or the number of assets if count_only is True
     """
-    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset_registry = _asset_registry()
     
     # Create a filter for the asset registry
-    ar_filter = unreal.ARFilter(
-        class_names=[asset_class],
-        package_paths=[directory_path],
-        recursive_paths=recursive
-    )
+    ar_filter = _make_filter((asset_class,), (directory_path,), recursive)
+    
+    # Count without keeping the result array around
+    if count_only:
+        return len(asset_registry.get_assets(ar_filter))
     
     # Get all assets that match the filter
     assets = asset_registry.get_assets(ar_filter)
     
     return assets
 
+def _bucket():
+    """
+    Get the current cache time bucket. It changes every _COUNT_TTL_SECONDS.
+    """
+    return int(time.monotonic() // _COUNT_TTL_SECONDS)
+
+@lru_cache(maxsize=32)
+def _count_cached(asset_class, bucket):
+    """
+    Count assets of a class, cached per time bucket.
+    """
+    return find_assets_by_class(asset_class, count_only=True)
+
+def count_assets_by_class(asset_class):
+    """
+    Count all assets of a specific class in /Game.
+    
+    Results are reused for up to 20 seconds, so repeated calls don't rescan the asset registry.
+    
+    Args:
+        asset_class (str): Class name to count, e.g., 'StaticMesh', 'Material'
+        
+    Returns:
+        int: Number of assets of the class
+    """
+    return _count_cached(asset_class, _bucket())
+
 def find_unused_assets(directory_path='/Game', recursive=True):
     """
     Find all unused assets in a directory.
@@ -71,28 +135,22 @@ def find_unused_assets(directory_path='/Game', recursive=True):
     Returns:
         list: List of unused asset data objects
     """
-    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset_registry = _asset_registry()
     
     # Get all assets in the directory
-    ar_filter = unreal.ARFilter(
-        package_paths=[directory_path],
-        recursive_paths=recursive
-    )
+    ar_filter = _make_filter((), (directory_path,), recursive)
     
     assets = asset_registry.get_assets(ar_filter)
-    unused_assets = []
     
-    # Check each asset for references
-    for asset in assets:
-        # Get dependencies (assets that this asset depends on)
-        dependencies = asset_registry.get_dependencies(asset.package_name)
-        
-        # Get referencers (assets that depend on this asset)
-        referencers = asset_registry.get_referencers(asset.package_name)
-        
-        # If no other assets reference this asset, it's unused
-        if len(referencers) == 0:
-            unused_assets.append(asset)
+    # Build the set of referenced packages in a single pass, querying
+    # referencers once per package rather than once per asset
+    referenced_packages = set()
+    for package_name in {asset.package_name for asset in assets}:
+        if asset_registry.get_referencers(package_name):
+            referenced_packages.add(package_name)
+    
+    # If no other assets reference an asset, it's unused
+    unused_assets = [asset for asset in assets if asset.package_name not in referenced_packages]
     
     return unused_assets
 
@@ -108,7 +166,7 @@ def duplicate_asset(source_asset_path, destination_path, destination_name):
     Returns:
         object: The duplicated asset object
     """
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    asset_tools = _asset_tools()
     
     # Load the source asset
     source_asset = unreal.load_asset(source_asset_path)
@@ -125,7 +183,7 @@ def duplicate_asset(source_asset_path, destination_path, destination_name):
     
     return duplicated_asset
 
-def bulk_rename_assets(directory_path, search_string, replace_string, recursive=True):
+def bulk_rename_assets(directory_path, search_string, replace_string, recursive=True, class_names=None):
     """
     Rename multiple assets by replacing a string in their names.
     
@@ -134,36 +192,73 @@ def bulk_rename_assets(directory_path, search_string, replace_string, recursive=
         search_string (str): String to search for in asset names
         replace_string (str): String to replace with
         recursive (bool): Whether to search subdirectories
+        class_names (list): Optional class names to restrict the search to
         
     Returns:
         int: Number of assets renamed
     """
     # Get all assets in the directory
-    assets = list_assets(directory_path, recursive)
+    assets = list_assets(directory_path, recursive, class_names=class_names)
+    
+    # Filter on the name first so only matching assets get loaded
+    names = [(asset, str(asset.asset_name)) for asset in assets]
+    matches = [(asset, asset_name) for asset, asset_name in names if search_string in asset_name]
+    
+    if not matches:
+        return 0
+    
+    # Rename by object path in a single batch, without loading each asset first
+    rename_data = []
+    renamed_paths = []
+    for asset, asset_name in matches:
+        new_name = asset_name.replace(search_string, replace_string)
+        old_path = f"{asset.package_name}.{asset_name}"
+        new_path = f"{asset.package_path}/{new_name}.{new_name}"
+        rename_data.append(unreal.AssetRenameData(
+            old_object_path=unreal.SoftObjectPath(old_path),
+            new_object_path=unreal.SoftObjectPath(new_path)
+        ))
+        renamed_paths.append((old_path, new_path))
+    
+    # rename_assets returns False if any rename failed, but still renames the others.
+    # An entry usually fails because its destination already exists, so only count
+    # the assets that are gone from their old path and exist at the new one.
+    if not _asset_tools().rename_assets(rename_data):
+        unreal.log_error(f"Failed to rename some assets in: {directory_path}")
+        does_asset_exist = unreal.EditorAssetLibrary.does_asset_exist
+        return sum(
+            1 for old_path, new_path in renamed_paths
+            if not does_asset_exist(old_path) and does_asset_exist(new_path)
+        )
     
-    renamed_count = 0
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    return len(rename_data)
+
+def import_assets(filenames, destination_path):
+    """
+    Import several assets from disk into the project in a single batch.
     
-    for asset in assets:
-        asset_name = asset.asset_name
+    Args:
+        filenames (list): Paths to the files on disk
+        destination_path (str): Path in the content browser to import to
         
-        # Check if the asset name contains the search string
-        if search_string in asset_name:
-            new_name = asset_name.replace(search_string, replace_string)
-            
-            # Rename the asset
-            package_path = asset.package_path
-            package_name = asset.package_name
-            object_path = f"{package_path}/{asset_name}"
-            
-            # Load the asset
-            loaded_asset = unreal.load_asset(object_path)
-            if loaded_asset:
-                # Rename the asset
-                asset_tools.rename_asset(loaded_asset, f"{package_path}/{new_name}")
-                renamed_count += 1
-    
-    return renamed_count
+    Returns:
+        list: Imported asset objects
+    """
+    # Create one import task per file
+    tasks = []
+    for filename in filenames:
+        task = unreal.AssetImportTask()
+        task.filename = filename
+        task.destination_path = destination_path
+        task.replace_existing = True
+        task.automated = True
+        task.save = True
+        tasks.append(task)
+    
+    # Execute all the import tasks at once. Missing files are reported by the importer.
+    _asset_tools().import_asset_tasks(tasks)
+    
+    return [path for task in tasks for path in task.imported_object_paths]
 
 def import_asset(filename, destination_path):
     """
@@ -176,24 +271,7 @@ def import_asset(filename, destination_path):
     Returns:
         list: Imported asset objects
     """
-    if not os.path.exists(filename):
-        unreal.log_error(f"File does not exist: {filename}")
-        return []
-    
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    
-    # Create import task
-    task = unreal.AssetImportTask()
-    task.filename = filename
-    task.destination_path = destination_path
-    task.replace_existing = True
-    task.automated = True
-    task.save = True
-    
-    # Execute the import task
-    asset_tools.import_asset_tasks([task])
-    
-    return task.imported_object_paths
+    return import_assets([filename], destination_path)
 
 # Example usage
 if __name__ == "__main__":
@@ -5,9 +5,43 @@ This module provides functions for automating tasks in the Unreal Editor.
 """
 
 import unreal
-import os
-import sys
-import time
+from functools import lru_cache
+
+# Menu section and entry settings shared by every entry created by create_menu_entry
+_SECTION_NAME = "PythonTools"
+_SECTION_LABEL = unreal.Text("Python Tools")
+_ENTRY_TYPE = unreal.MultiBlockType.TOOL_BAR_BUTTON
+_COMMAND_TYPE = unreal.ToolMenuStringCommandType.PYTHON
+
+@lru_cache(maxsize=1)
+def _asset_tools():
+    """
+    Get the asset tools, looked up once per session.
+    """
+    return unreal.AssetToolsHelpers.get_asset_tools()
+
+@lru_cache(maxsize=None)
+def _editor_subsystem(subsystem_class):
+    """
+    Get an editor subsystem, looked up once per class per session.
+    """
+    return unreal.get_editor_subsystem(subsystem_class)
+
+def _make_entry(menu_name, entry_name):
+    """
+    Build a menu entry that runs the callable registered for it in PythonTools.menu_dispatch.
+    """
+    return unreal.ToolMenuEntry(
+        name=entry_name,
+        type=_ENTRY_TYPE,
+        label=unreal.Text(entry_name),
+        tooltip=unreal.Text(f"Execute {entry_name}"),
+        command=unreal.ToolMenuStringCommand(
+            type=_COMMAND_TYPE,
+            custom_type="PythonCommand",
+            string=f"import PythonTools.menu_dispatch as d; d.run({menu_name!r}, {entry_name!r})"
+        )
+    )
 
 def create_editor_utility_widget(widget_name, parent_class=None, destination_path='/Game/EditorUtilities'):
     """
@@ -22,7 +56,7 @@ def create_editor_utility_widget(widget_name, parent_class=None, destination_pat
         object: The created widget blueprint
     """
     # Get the asset tools
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    asset_tools = _asset_tools()
     
     # Set the parent class for the widget
     if parent_class is None:
@@ -49,7 +83,7 @@ def create_editor_utility_blueprint(blueprint_name, destination_path='/Game/Edit
         object: The created blueprint
     """
     # Get the asset tools
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    asset_tools = _asset_tools()
     
     # Create the blueprint
     blueprint_factory = unreal.EditorUtilityBlueprintFactory()
@@ -74,7 +108,7 @@ def register_editor_command(command_name, python_callable, description=""):
     """
     try:
         # Get the editor subsystem
-        editor_subsystem = unreal.get_editor_subsystem(unreal.EditorScriptingUtilities)
+        editor_subsystem = _editor_subsystem(unreal.EditorScriptingUtilities)
         
         # Register the command
         editor_subsystem.register_python_command(
@@ -100,7 +134,7 @@ def batch_rename_selected_actors(search_string, replace_string):
         int: Number of actors renamed
     """
     # Get the editor subsystem
-    editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    editor_subsystem = _editor_subsystem(unreal.EditorActorSubsystem)
     
     # Get selected actors
     selected_actors = editor_subsystem.get_selected_level_actors()
@@ -134,7 +168,7 @@ def take_editor_screenshot(filename, resolution_x=1920, resolution_y=1080):
     """
     try:
         # Get the editor subsystem
-        editor_subsystem = unreal.get_editor_subsystem(unreal.EditorLevelLibrary)
+        editor_subsystem = _editor_subsystem(unreal.EditorLevelLibrary)
         
         # Take the screenshot
         editor_subsystem.take_high_resolution_screenshot(
@@ -157,7 +191,7 @@ def build_lighting():
     """
     try:
         # Get the editor subsystem
-        editor_subsystem = unreal.get_editor_subsystem(unreal.EditorLevelLibrary)
+        editor_subsystem = _editor_subsystem(unreal.EditorLevelLibrary)
         
         # Build lighting
         editor_subsystem.build_lighting()
@@ -171,6 +205,8 @@ def create_menu_entry(menu_name, entry_name, python_callable):
     """
     Create a menu entry in the editor.
     
+    Call refresh_menus() once after adding all entries so they show up.
+    
     Args:
         menu_name (str): Name of the menu to add the entry to
         entry_name (str): Name of the menu entry
@@ -179,6 +215,13 @@ def create_menu_entry(menu_name, entry_name, python_callable):
     Returns:
         bool: True if the menu entry was created successfully
     """
+    # Menu entries dispatch through the PythonTools plugin package
+    try:
+        from PythonTools import menu_dispatch
+    except ImportError:
+        unreal.log_error("create_menu_entry requires the PythonTools plugin to be enabled")
+        return False
+    
     try:
         # Get the tool menus
         tool_menus = unreal.ToolMenus.get()
@@ -190,46 +233,59 @@ def create_menu_entry(menu_name, entry_name, python_callable):
             return False
         
         # Create a section if it doesn't exist
-        section_name = "PythonTools"
-        section = menu.find_section(section_name)
+        section = menu.find_section(_SECTION_NAME)
         if not section:
-            menu.add_section(section_name, unreal.Text("Python Tools"))
+            menu.add_section(_SECTION_NAME, _SECTION_LABEL)
         
-        # Create the menu entry
-        entry = unreal.ToolMenuEntry(
-            name=entry_name,
-            type=unreal.MultiBlockType.TOOL_BAR_BUTTON,
-            label=unreal.Text(entry_name),
-            tooltip=unreal.Text(f"Execute {entry_name}"),
-            command=unreal.ToolMenuStringCommand(
-                type=unreal.ToolMenuStringCommandType.PYTHON,
-                custom_type="PythonCommand",
-                string=f"import unreal; {python_callable.__module__}.{python_callable.__name__}()"
-            )
-        )
+        # Register the callable so the click doesn't resolve it from a string
+        menu_dispatch.register(menu_name, entry_name, python_callable)
         
-        # Add the entry to the menu
-        menu.add_menu_entry(section_name, entry)
+        # The entry already exists if registration is re-run, only the callable needs updating
+        if menu_dispatch.has_entry(menu_name, entry_name):
+            return True
         
-        # Refresh the menus
-        tool_menus.refresh_all_widgets()
+        # Create the menu entry and add it to the menu
+        menu.add_menu_entry(_SECTION_NAME, _make_entry(menu_name, entry_name))
+        menu_dispatch.add_entry(menu_name, entry_name)
         
         return True
     except Exception as e:
         unreal.log_error(f"Failed to create menu entry: {e}")
         return False
 
-def run_automated_tests(test_names=None, timeout_seconds=300):
+def refresh_menus():
+    """
+    Refresh the editor menus so newly added entries are shown.
+    
+    This rebuilds every menu widget, so call it once after adding a batch of entries.
+    """
+    unreal.ToolMenus.get().refresh_all_widgets()
+
+def run_automated_tests(test_names=None, timeout_seconds=300, on_complete=None):
     """
     Run automated tests in the editor.
     
+    The tests run asynchronously. Completion is checked on each editor tick
+    rather than by blocking the editor thread, so the result is only known
+    once the tests finish or time out. It's passed to on_complete if given,
+    otherwise it's logged.
+    
     Args:
         test_names (list): List of test names to run, or None to run all tests
         timeout_seconds (int): Timeout in seconds
-        
-    Returns:
-        bool: True if all tests passed
+        on_complete (callable): Optional function called with True if all tests passed,
+            or False if any failed, timed out or couldn't be started
     """
+    import time
+    
+    def _report(passed):
+        if on_complete:
+            on_complete(passed)
+        elif passed:
+            unreal.log("All automated tests passed")
+        else:
+            unreal.log_error("Automated tests failed")
+    
     try:
         # Get the automation controller
         automation = unreal.AutomationBlueprintLibrary.get_automation_controller()
@@ -241,19 +297,30 @@ def run_automated_tests(test_names=None, timeout_seconds=300):
         else:
             automation.run_all_tests()
         
-        # Wait for tests to complete
-        start_time = time.time()
-        while automation.is_running_tests():
-            time.sleep(0.1)
-            if time.time() - start_time > timeout_seconds:
-                unreal.log_error("Test timeout exceeded")
-                return False
+        deadline = time.monotonic() + timeout_seconds
         
-        # Check if all tests passed
-        return automation.did_all_tests_pass()
+        # Check for completion on each editor tick
+        def _tick(delta_seconds):
+            passed = False
+            try:
+                if automation.is_running_tests():
+                    if time.monotonic() < deadline:
+                        return
+                    unreal.log_error("Test timeout exceeded")
+                else:
+                    # Check if all tests passed
+                    passed = automation.did_all_tests_pass()
+            except Exception as e:
+                unreal.log_error(f"Failed to check automated test results: {e}")
+            
+            # Only reached once the tests are done, timed out or the check failed
+            unreal.unregister_slate_post_tick_callback(handle)
+            _report(passed)
+        
+        handle = unreal.register_slate_post_tick_callback(_tick)
     except Exception as e:
         unreal.log_error(f"Failed to run automated tests: {e}")
-        return False
+        _report(False)
 
 # Example usage
 if __name__ == "__main__":
@@ -264,4 +331,5 @@ if __name__ == "__main__":
     register_editor_command("HelloWorld", hello_world, "Print a hello message")
     
     # Create a menu entry
-    create_menu_entry("LevelEditor.MainMenu.Window", "Hello World", hello_world) 
\ No newline at end of file
+    create_menu_entry("LevelEditor.MainMenu.Window", "Hello World", hello_world)
+    refresh_menus() 
\ No newline at end of file
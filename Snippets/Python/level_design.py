@@ -7,40 +7,145 @@ This module provides functions for automating level design tasks in Unreal Engin
 import unreal
 import math
 import random
+import time
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
-def spawn_actor(actor_class, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+# Assets loaded by _load_asset_cached, keyed by path in least to most recently used order.
+# Failed loads aren't stored.
+_ASSET_CACHE = {}
+_ASSET_CACHE_SIZE = 256
+
+# Surface trace results from align_actors_to_surface, mapping the rounded trace start,
+# distance and channel to the aligned (location, rotation)
+_ALIGN_CACHE = {}
+
+# Path name of the editor world the align cache was filled in, so it's dropped on map change
+_ALIGN_WORLD = None
+
+# Where align_actors_to_surface last placed each actor, keyed by actor path name,
+# trace distance and channel so different trace settings always trace again
+_LAST_ALIGNED = {}
+
+@lru_cache(maxsize=1)
+def _get_eas():
     """
-    Spawn an actor in the current level.
+    Get the editor actor subsystem, looked up once per session.
+    """
+    return unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+
+def _load_asset_cached(path):
+    """
+    Load an asset, reusing the result for repeated loads of the same path.
+    
+    Only successful loads are cached, so a path that doesn't load yet is retried
+    on the next call. The least recently used entry is dropped once the cache is full.
+    """
+    # Re-insert hits so the dict stays in least to most recently used order
+    asset = _ASSET_CACHE.pop(path, None)
+    if asset is None:
+        asset = unreal.load_asset(path)
+        if not asset:
+            return asset
+        if len(_ASSET_CACHE) >= _ASSET_CACHE_SIZE:
+            del _ASSET_CACHE[next(iter(_ASSET_CACHE))]
+    _ASSET_CACHE[path] = asset
+    return asset
+
+def _direction_rotation(direction):
+    """
+    Get the pitch and yaw that point along a direction vector.
+    
+    Gives the same result as unreal.Rotator.from_vector without calling into the engine.
     
     Args:
-        actor_class (class): Class of the actor to spawn
-        location (tuple): Location to spawn the actor at (X, Y, Z)
-        rotation (tuple): Rotation of the actor (Pitch, Yaw, Roll)
-        scale (tuple): Scale of the actor (X, Y, Z)
+        direction (unreal.Vector): Direction to point along
         
     Returns:
-        object: The spawned actor
+        tuple: (pitch, yaw) in degrees
+    """
+    x, y, z = direction.x, direction.y, direction.z
+    return math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x))
+
+def invalidate_asset_cache():
     """
-    # Get the editor subsystem
-    editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    Clear the cache of assets loaded by spawn_static_mesh, spawn_static_meshes
+    and create_instanced_grid.
     
-    # Convert location, rotation, and scale to Unreal types
-    location = unreal.Vector(location[0], location[1], location[2])
-    rotation = unreal.Rotator(rotation[0], rotation[1], rotation[2])
-    scale = unreal.Vector(scale[0], scale[1], scale[2])
+    Call this after reloading or replacing assets in the editor.
+    """
+    _ASSET_CACHE.clear()
+
+@contextmanager
+def _batch_spawn_context(description="Bulk Spawn"):
+    """
+    Group the spawns in the block into one undo transaction.
     
-    # Create a transform
-    transform = unreal.Transform(location, rotation, scale)
+    Recording an undo entry after every spawn dominates the cost of bulk spawns.
+    The viewport isn't frozen while they run, as UE 5.5 has no Python API for
+    toggling viewport realtime.
     
-    # Spawn the actor
+    Args:
+        description (str): Name of the undo transaction
+    """
+    with unreal.ScopedEditorTransaction(description):
+        yield
+
+def _spawn_raw(editor_subsystem, actor_class, location, rotation, scale=None):
+    """
+    Spawn an actor from values that are already Unreal types.
+    
+    Does no conversion or subsystem lookup, for bulk spawn loops.
+    
+    Args:
+        editor_subsystem (object): The editor actor subsystem to spawn with
+        actor_class (class): Class of the actor to spawn
+        location (unreal.Vector): Location to spawn the actor at
+        rotation (unreal.Rotator): Rotation of the actor
+        scale (unreal.Vector): Scale of the actor, or None to keep the default scale
+        
+    Returns:
+        object: The spawned actor
+    """
     actor = editor_subsystem.spawn_actor_from_class(actor_class, location, rotation)
     
-    # Set the actor's scale
-    if actor:
+    if actor and scale is not None:
         actor.set_actor_scale3d(scale)
     
     return actor
 
+def spawn_actor(actor_class, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+    """
+    Spawn an actor in the current level.
+    
+    Args:
+        actor_class (class): Class of the actor to spawn
+        location (tuple or unreal.Vector): Location to spawn the actor at (X, Y, Z)
+        rotation (tuple or unreal.Rotator): Rotation of the actor (Pitch, Yaw, Roll)
+        scale (tuple or unreal.Vector): Scale of the actor (X, Y, Z)
+        
+    Returns:
+        object: The spawned actor
+    """
+    # Convert location, rotation, and scale to Unreal types if needed.
+    # Rotator's positional order is (roll, pitch, yaw), so pass the tuple by keyword.
+    if not isinstance(location, unreal.Vector):
+        location = unreal.Vector(location[0], location[1], location[2])
+    if not isinstance(rotation, unreal.Rotator):
+        rotation = unreal.Rotator(pitch=rotation[0], yaw=rotation[1], roll=rotation[2])
+    
+    # Spawned actors already have a scale of 1, so only keep a scale that needs setting
+    if isinstance(scale, unreal.Vector):
+        if scale.x == scale.y == scale.z == 1:
+            scale = None
+    elif tuple(scale) == (1, 1, 1):
+        scale = None
+    else:
+        scale = unreal.Vector(scale[0], scale[1], scale[2])
+    
+    # Spawn the actor
+    return _spawn_raw(_get_eas(), actor_class, location, rotation, scale)
+
 def spawn_static_mesh(static_mesh_path, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
     """
     Spawn a static mesh actor in the current level.
@@ -55,7 +160,7 @@ def spawn_static_mesh(static_mesh_path, location=(0, 0, 0), rotation=(0, 0, 0),
         object: The spawned static mesh actor
     """
     # Load the static mesh asset
-    static_mesh = unreal.load_asset(static_mesh_path)
+    static_mesh = _load_asset_cached(static_mesh_path)
     if not static_mesh:
         unreal.log_error(f"Failed to load static mesh: {static_mesh_path}")
         return None
@@ -69,6 +174,62 @@ def spawn_static_mesh(static_mesh_path, location=(0, 0, 0), rotation=(0, 0, 0),
     
     return actor
 
+def spawn_static_meshes(static_mesh_path, transforms):
+    """
+    Spawn many static mesh actors that share the same mesh.
+    
+    The mesh is loaded once and the viewport isn't redrawn between spawns,
+    which is much faster than calling spawn_static_mesh in a loop.
+    
+    Args:
+        static_mesh_path (str): Path to the static mesh asset
+        transforms (list): List of (location, rotation, scale) tuples, rotation and scale are optional
+        
+    Returns:
+        dict: 'actors' with the spawned actors, 'failures' mapping the index of each transform
+            that failed to the error message, and 'elapsed_ms' with the time taken
+    """
+    start_time = time.perf_counter()
+    
+    actors = []
+    failures = {}
+    
+    # Load the static mesh asset once for every actor
+    static_mesh = _load_asset_cached(static_mesh_path)
+    if not static_mesh:
+        error = f"Failed to load static mesh: {static_mesh_path}"
+        unreal.log_error(error)
+        
+        # Every transform fails, but callers still get the usual result
+        return {
+            'actors': actors,
+            'failures': {i: error for i in range(len(transforms))},
+            'elapsed_ms': (time.perf_counter() - start_time) * 1000.0
+        }
+    
+    set_static_mesh = unreal.StaticMeshComponent.set_static_mesh
+    
+    with _batch_spawn_context("Spawn Static Meshes"):
+        for i, transform in enumerate(transforms):
+            try:
+                # Spawn a static mesh actor
+                actor = spawn_actor(unreal.StaticMeshActor, *transform)
+                if not actor:
+                    failures[i] = "Failed to spawn actor"
+                    continue
+                
+                # Set the static mesh
+                set_static_mesh(actor.static_mesh_component, static_mesh)
+                actors.append(actor)
+            except Exception as e:
+                failures[i] = str(e)
+    
+    return {
+        'actors': actors,
+        'failures': failures,
+        'elapsed_ms': (time.perf_counter() - start_time) * 1000.0
+    }
+
 def create_grid_of_actors(actor_class, rows, columns, spacing_x=100, spacing_y=100, start_location=(0, 0, 0)):
     """
     Create a grid of actors in the current level.
@@ -84,23 +245,87 @@ def create_grid_of_actors(actor_class, rows, columns, spacing_x=100, spacing_y=1
     Returns:
         list: List of spawned actors
     """
-    actors = []
-    
-    for row in range(rows):
-        for col in range(columns):
-            # Calculate the location for this actor
-            x = start_location[0] + col * spacing_x
-            y = start_location[1] + row * spacing_y
-            z = start_location[2]
-            
-            # Spawn the actor
-            actor = spawn_actor(actor_class, (x, y, z))
-            
-            if actor:
-                actors.append(actor)
+    # Calculate all the locations up front, row by row
+    start_x, start_y, z = start_location
+    xs = [start_x + col * spacing_x for col in range(columns)]
+    Vector = unreal.Vector
+    locations = [Vector(x, start_y + row * spacing_y, z) for row in range(rows) for x in xs]
+    rotation = unreal.Rotator()
+    
+    # Spawn the actors, keeping the ones that spawned successfully
+    spawn = partial(_spawn_raw, _get_eas(), actor_class)
+    with _batch_spawn_context("Create Grid of Actors"):
+        actors = [actor for actor in (spawn(location, rotation) for location in locations) if actor]
     
     return actors
 
+def create_instanced_grid(static_mesh_path, rows, columns, spacing_x=100, spacing_y=100, start_location=(0, 0, 0)):
+    """
+    Create a grid of static mesh instances on a single actor.
+    
+    All the instances live in one HierarchicalInstancedStaticMeshComponent, so this
+    spawns one actor instead of rows * columns and renders with far fewer draw calls.
+    The trade-off is that the instances can't be selected and moved individually
+    like the actors from create_grid_of_actors. The actor is placed at start_location
+    and the instances are offset from it, so its pivot is at the first instance.
+    
+    Args:
+        static_mesh_path (str): Path to the static mesh asset
+        rows (int): Number of rows in the grid
+        columns (int): Number of columns in the grid
+        spacing_x (float): Spacing between instances in the X direction
+        spacing_y (float): Spacing between instances in the Y direction
+        start_location (tuple): Starting location for the grid (X, Y, Z)
+        
+    Returns:
+        object: The actor holding the instances, or None if it couldn't be created
+    """
+    # Load the static mesh asset
+    static_mesh = _load_asset_cached(static_mesh_path)
+    if not static_mesh:
+        unreal.log_error(f"Failed to load static mesh: {static_mesh_path}")
+        return None
+    
+    # Group the spawn and component setup into a single undo transaction
+    with unreal.ScopedEditorTransaction("Create Instanced Grid"):
+        # Spawn one actor to hold all the instances. A bare Actor has no root component
+        # to hold a location yet, so it's moved once the component has been added.
+        actor = spawn_actor(unreal.Actor)
+        if not actor:
+            return None
+        
+        # Add the instanced static mesh component to the actor
+        subobject_subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        root_handle = subobject_subsystem.k2_gather_subobject_data_for_instance(actor)[0]
+        hism_handle, fail_reason = subobject_subsystem.add_new_subobject(
+            unreal.AddNewSubobjectParams(
+                parent_handle=root_handle,
+                new_class=unreal.HierarchicalInstancedStaticMeshComponent
+            )
+        )
+        if not fail_reason.is_empty():
+            # Don't leave an empty actor behind in the level
+            unreal.log_error(f"Failed to add instanced static mesh component: {fail_reason}")
+            _get_eas().destroy_actor(actor)
+            return None
+        
+        subobject_data = unreal.SubobjectDataBlueprintFunctionLibrary.get_data(hism_handle)
+        hism = unreal.SubobjectDataBlueprintFunctionLibrary.get_object(subobject_data)
+        hism.set_static_mesh(static_mesh)
+        
+        # Move the actor, now rooted at the component, to the start of the grid
+        actor.set_actor_location(unreal.Vector(start_location[0], start_location[1], start_location[2]), False, True)
+        
+        # Add all the instances in one call, in the actor's local space
+        transforms = [
+            unreal.Transform(location=unreal.Vector(col * spacing_x, row * spacing_y, 0))
+            for row in range(rows)
+            for col in range(columns)
+        ]
+        hism.add_instances(transforms, False, False)
+    
+    return actor
+
 def create_circle_of_actors(actor_class, num_actors, radius, center_location=(0, 0, 0), face_center=True):
     """
     Create a circle of actors in the current level.
@@ -115,33 +340,31 @@ def create_circle_of_actors(actor_class, num_actors, radius, center_location=(0,
     Returns:
         list: List of spawned actors
     """
-    actors = []
-    
-    for i in range(num_actors):
-        # Calculate the angle for this actor
-        angle = 2 * math.pi * i / num_actors
-        
-        # Calculate the location for this actor
-        x = center_location[0] + radius * math.cos(angle)
-        y = center_location[1] + radius * math.sin(angle)
-        z = center_location[2]
-        
-        # Calculate the rotation for this actor
-        if face_center:
-            # Calculate the rotation to face the center
-            rotation = (0, math.degrees(angle) + 90, 0)
-        else:
-            rotation = (0, 0, 0)
-        
-        # Spawn the actor
-        actor = spawn_actor(actor_class, (x, y, z), rotation)
-        
-        if actor:
-            actors.append(actor)
+    # Calculate the angle and location for every actor up front
+    center_x, center_y, z = center_location
+    cos, sin, degrees = math.cos, math.sin, math.degrees
+    angles = [2 * math.pi * i / num_actors for i in range(num_actors)]
+    Vector = unreal.Vector
+    locations = [Vector(center_x + radius * cos(angle), center_y + radius * sin(angle), z) for angle in angles]
+    
+    # Calculate the rotations, facing the center or all sharing one unrotated Rotator
+    Rotator = unreal.Rotator
+    if face_center:
+        rotations = [Rotator(yaw=degrees(angle) + 90) for angle in angles]
+    else:
+        rotations = [Rotator()] * num_actors
+    
+    # Spawn the actors, keeping the ones that spawned successfully
+    spawn = partial(_spawn_raw, _get_eas(), actor_class)
+    with _batch_spawn_context("Create Circle of Actors"):
+        actors = [
+            actor for actor in (spawn(location, rotation) for location, rotation in zip(locations, rotations))
+            if actor
+        ]
     
     return actors
 
-def create_random_scatter(actor_class, num_actors, min_x, max_x, min_y, max_y, z=0, min_scale=0.8, max_scale=1.2, random_rotation=True):
+def create_random_scatter(actor_class, num_actors, min_x, max_x, min_y, max_y, z=0, min_scale=0.8, max_scale=1.2, random_rotation=True, seed=None):
     """
     Create a random scatter of actors in the current level.
     
@@ -156,39 +379,69 @@ def create_random_scatter(actor_class, num_actors, min_x, max_x, min_y, max_y, z
         min_scale (float): Minimum scale factor
         max_scale (float): Maximum scale factor
         random_rotation (bool): Whether to apply random rotation
+        seed (int): Optional seed to make the scatter reproducible
         
     Returns:
         list: List of spawned actors
     """
-    actors = []
-    
-    for i in range(num_actors):
-        # Generate random location
-        x = random.uniform(min_x, max_x)
-        y = random.uniform(min_y, max_y)
-        
-        # Generate random rotation
-        if random_rotation:
-            rotation = (0, random.uniform(0, 360), 0)
-        else:
-            rotation = (0, 0, 0)
-        
-        # Generate random scale
-        scale_factor = random.uniform(min_scale, max_scale)
-        scale = (scale_factor, scale_factor, scale_factor)
-        
-        # Spawn the actor
-        actor = spawn_actor(actor_class, (x, y, z), rotation, scale)
-        
-        if actor:
-            actors.append(actor)
+    # Generate all the random values up front from a generator owned by this call
+    uniform = random.Random(seed).uniform
+    xs = [uniform(min_x, max_x) for _ in range(num_actors)]
+    ys = [uniform(min_y, max_y) for _ in range(num_actors)]
+    yaws = [uniform(0, 360) for _ in range(num_actors)] if random_rotation else [0] * num_actors
+    scale_factors = [uniform(min_scale, max_scale) for _ in range(num_actors)]
+    
+    # Spawn the actors, keeping the ones that spawned successfully
+    Vector = unreal.Vector
+    Rotator = unreal.Rotator
+    spawn = partial(_spawn_raw, _get_eas(), actor_class)
+    with _batch_spawn_context("Create Random Scatter"):
+        actors = [
+            actor for actor in (
+                spawn(
+                    Vector(x, y, z), Rotator(yaw=yaw),
+                    Vector(scale_factor, scale_factor, scale_factor) if scale_factor != 1 else None
+                )
+                for x, y, yaw, scale_factor in zip(xs, ys, yaws, scale_factors)
+            )
+            if actor
+        ]
     
     return actors
 
+def _align_key(location, trace_distance, trace_channel):
+    """
+    Build the _ALIGN_CACHE key for a trace starting at location.
+    """
+    return (round(location.x, 2), round(location.y, 2), round(location.z, 2), trace_distance, trace_channel)
+
+def clear_align_cache():
+    """
+    Clear the cached surface traces used by align_actors_to_surface, and forget
+    where it last placed each actor so the next call realigns them all.
+    
+    Call this after moving or editing the geometry that actors are aligned to.
+    """
+    _ALIGN_CACHE.clear()
+    _LAST_ALIGNED.clear()
+
+def clear_align_tracking():
+    """
+    Forget where align_actors_to_surface last placed each actor, so the next call realigns them all.
+    """
+    _LAST_ALIGNED.clear()
+
 def align_actors_to_surface(actors, trace_distance=10000, trace_channel='Visibility'):
     """
     Align actors to the surface below them.
     
+    Trace results are cached for the current map, so aligning actors from the same
+    positions again doesn't repeat the traces, and actors that haven't moved since
+    they were last aligned with the same trace settings are skipped and still counted
+    as aligned. Only the location is checked, so an actor that was rotated but not
+    moved is skipped too. Call clear_align_cache() if the surfaces change or to
+    realign rotated actors.
+    
     Args:
         actors (list): List of actors to align
         trace_distance (float): Maximum distance to trace
@@ -197,45 +450,68 @@ def align_actors_to_surface(actors, trace_distance=10000, trace_channel='Visibil
     Returns:
         int: Number of actors aligned
     """
+    global _ALIGN_WORLD
     aligned_count = 0
     
-    for actor in actors:
-        # Get the actor's location
-        location = actor.get_actor_location()
-        
-        # Create a trace start and end point
-        start = unreal.Vector(location.x, location.y, location.z)
-        end = unreal.Vector(location.x, location.y, location.z - trace_distance)
-        
-        # Perform the trace
-        hit_result = unreal.SystemLibrary.line_trace_single(
-            actor,
-            start,
-            end,
-            trace_channel,
-            False,
-            [],
-            unreal.DrawDebugTrace.NONE,
-            True,
-            unreal.LinearColor(1.0, 0.0, 0.0, 1.0),
-            unreal.LinearColor(0.0, 1.0, 0.0, 1.0),
-            5.0
-        )
-        
-        # If we hit something, align the actor to the hit location
-        if hit_result.hit_actor:
-            # Get the hit location
-            hit_location = hit_result.hit_location
+    # Cached traces only apply to the map they were made in
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    world_name = world.get_path_name() if world else None
+    if world_name != _ALIGN_WORLD:
+        _ALIGN_CACHE.clear()
+        _ALIGN_WORLD = world_name
+    
+    # The Python API has no batched line trace, so there's still one trace per uncached actor
+    locations = [actor.get_actor_location() for actor in actors]
+    
+    # Look these up once rather than on every iteration
+    line_trace_single = unreal.SystemLibrary.line_trace_single
+    no_debug_draw = unreal.DrawDebugTrace.NONE
+    
+    # Group all the moves into a single undo transaction
+    with unreal.ScopedEditorTransaction("Align Actors to Surface"):
+        for actor, start in zip(actors, locations):
+            # Skip actors that haven't moved since they were last aligned
+            actor_key = (actor.get_path_name(), trace_distance, trace_channel)
+            if _LAST_ALIGNED.get(actor_key) == start:
+                aligned_count += 1
+                continue
             
-            # Get the hit normal
-            hit_normal = hit_result.hit_normal
+            key = _align_key(start, trace_distance, trace_channel)
+            aligned = _ALIGN_CACHE.get(key)
             
-            # Calculate the rotation to align with the surface
-            rotation = unreal.Rotator.from_vector(hit_normal)
+            if aligned is None:
+                # Perform a simple-collision trace. Debug drawing is off, so the
+                # colour and draw time arguments are left at their defaults.
+                end = unreal.Vector(start.x, start.y, start.z - trace_distance)
+                hit_result = line_trace_single(
+                    actor,
+                    start,
+                    end,
+                    trace_channel,
+                    False,
+                    [],
+                    no_debug_draw,
+                    True
+                )
+                
+                # Skip actors with nothing below them
+                if not hit_result.hit_actor:
+                    continue
+                
+                # Calculate the rotation to align with the surface
+                pitch, yaw = _direction_rotation(hit_result.hit_normal)
+                rotation = unreal.Rotator(pitch=pitch, yaw=yaw, roll=0.0)
+                aligned = (hit_result.hit_location, rotation)
+                
+                # Cache under the aligned position too, so re-aligning the actor reuses the result
+                _ALIGN_CACHE[key] = aligned
+                _ALIGN_CACHE[_align_key(aligned[0], trace_distance, trace_channel)] = aligned
             
             # Set the actor's location and rotation
+            hit_location, rotation = aligned
             actor.set_actor_location(hit_location)
             actor.set_actor_rotation(rotation)
+            _LAST_ALIGNED[actor_key] = hit_location
             
             aligned_count += 1
     
@@ -262,34 +538,21 @@ def create_spline_path(spline_actor_class, points, tangents=None):
     # Get the spline component
     spline_component = spline_actor.spline_component
     
-    # Clear any existing points
-    spline_component.clear_spline_points()
+    # Set all the points in one call, replacing any existing points.
+    # The spline is only rebuilt once, after all the points and tangents are set.
+    world_space = unreal.SplineCoordinateSpace.WORLD
+    point_vectors = [unreal.Vector(point[0], point[1], point[2]) for point in points]
+    spline_component.set_spline_points(point_vectors, world_space, False)
     
-    # Add the points to the spline
-    for i, point in enumerate(points):
-        # Convert the point to a Vector
-        point_vector = unreal.Vector(point[0], point[1], point[2])
-        
-        # Add the point to the spline
-        if tangents and i < len(tangents):
-            # Convert the tangent to a Vector
-            tangent_vector = unreal.Vector(tangents[i][0], tangents[i][1], tangents[i][2])
-            
-            # Add the point with the tangent
-            spline_component.add_point(
-                point_vector,
-                tangent_vector,
-                unreal.SplinePointType.CURVE,
-                True
-            )
-        else:
-            # Add the point without a tangent
-            spline_component.add_point(
-                point_vector,
-                unreal.Vector(0, 0, 0),
-                unreal.SplinePointType.LINEAR,
-                True
-            )
+    # Points with a tangent are curves, the rest are linear
+    num_tangents = min(len(tangents), len(points)) if tangents else 0
+    for i in range(num_tangents):
+        tangent_vector = unreal.Vector(tangents[i][0], tangents[i][1], tangents[i][2])
+        spline_component.set_tangent_at_spline_point(i, tangent_vector, world_space, False)
+    for i in range(num_tangents, len(points)):
+        spline_component.set_spline_point_type(i, unreal.SplinePointType.LINEAR, False)
+    
+    spline_component.update_spline()
     
     return spline_actor
 
@@ -308,8 +571,6 @@ def place_actors_along_spline(spline_actor, actor_class, num_actors, offset=0, r
     Returns:
         list: List of spawned actors
     """
-    actors = []
-    
     # Get the spline component
     spline_component = spline_actor.spline_component
     
@@ -319,40 +580,52 @@ def place_actors_along_spline(spline_actor, actor_class, num_actors, offset=0, r
     # Calculate the spacing between actors
     spacing = spline_length / (num_actors - 1) if num_actors > 1 else 0
     
-    for i in range(num_actors):
-        # Calculate the distance along the spline
-        distance = i * spacing
-        
+    # Calculate the distance along the spline for each actor
+    distances = [i * spacing for i in range(num_actors)]
+    
+    # Bind the functions used in the loop to locals
+    get_location = spline_component.get_location_at_distance_along_spline
+    get_direction = spline_component.get_direction_at_distance_along_spline
+    world_space = unreal.SplineCoordinateSpace.WORLD
+    direction_rotation = _direction_rotation
+    Rotator = unreal.Rotator
+    hypot = math.hypot
+    
+    # Calculate where each actor goes and how it's rotated
+    placements = []
+    for distance in distances:
         # Get the location and direction at this distance
-        location = spline_component.get_location_at_distance_along_spline(distance, unreal.SplineCoordinateSpace.WORLD)
-        direction = spline_component.get_direction_at_distance_along_spline(distance, unreal.SplineCoordinateSpace.WORLD)
+        location = get_location(distance, world_space)
+        direction = get_direction(distance, world_space)
         
         # Calculate the rotation
         if align_to_spline:
-            # Calculate the rotation to align with the spline direction
-            rotation = unreal.Rotator.from_vector(direction)
-            
-            # Add the rotation offset
-            rotation.pitch += rotation_offset[0]
-            rotation.yaw += rotation_offset[1]
-            rotation.roll += rotation_offset[2]
+            # Calculate the rotation to align with the spline direction, plus the rotation offset
+            pitch, yaw = direction_rotation(direction)
+            rotation = Rotator(
+                pitch=pitch + rotation_offset[0],
+                yaw=yaw + rotation_offset[1],
+                roll=rotation_offset[2]
+            )
         else:
-            rotation = unreal.Rotator(rotation_offset[0], rotation_offset[1], rotation_offset[2])
+            rotation = Rotator(pitch=rotation_offset[0], yaw=rotation_offset[1], roll=rotation_offset[2])
         
         # Calculate the offset location
         if offset != 0:
-            # Calculate the right vector
-            right = unreal.MathLibrary.cross_product(direction, unreal.Vector(0, 0, 1))
-            right = unreal.MathLibrary.normal(right)
+            # Calculate the right vector, direction x up normalized, without calling into the engine
+            right_x, right_y = direction.y, -direction.x
+            right_length = hypot(right_x, right_y) or 1.0
             
             # Apply the offset
-            location += right * offset
+            location.x += right_x / right_length * offset
+            location.y += right_y / right_length * offset
         
-        # Spawn the actor
-        actor = spawn_actor(actor_class, (location.x, location.y, location.z), (rotation.pitch, rotation.yaw, rotation.roll))
-        
-        if actor:
-            actors.append(actor)
+        placements.append((location, rotation))
+    
+    # Spawn the actors, keeping the ones that spawned successfully
+    spawn = partial(_spawn_raw, _get_eas(), actor_class)
+    with _batch_spawn_context("Place Actors Along Spline"):
+        actors = [actor for actor in (spawn(location, rotation) for location, rotation in placements) if actor]
     
     return actors
 